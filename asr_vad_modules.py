@@ -1,6 +1,7 @@
 from PySide6.QtCore import QThread, Signal
 import whisper
 import speech_recognition as sr
+import sounddevice as sd
 import torch
 import numpy as np
 import requests
@@ -9,47 +10,165 @@ import json
 class WhisperTranscriptionThread(QThread):
     transcription_signal = Signal(str)
 
-    def __init__(self, model="medium", device="cpu", language="en", energy_threshold=1000, record_timeout=2.0, parent=None, logger=None):
+    def __init__(self, model="medium", device="cpu", language="en", energy_threshold=1000, record_timeout=2.0, vad_threshold=0.5, parent=None, logger=None):
         super().__init__(parent)
         self.model_name = model
         self.device = device
         self.language = language
         self.energy_threshold = energy_threshold
         self.record_timeout = record_timeout
+        # Silero speech probability threshold; lower it (e.g. 0.3) for
+        # whispered or very quiet voices
+        self.vad_threshold = vad_threshold
         self.running = True
         self.logger = logger
 
     def run(self):
         try:
             self.logger.log_info("Starting Whisper Transcription Thread")
-            recorder = sr.Recognizer()
-            recorder.energy_threshold = self.energy_threshold
-            recorder.dynamic_energy_threshold = False
-
-            source = sr.Microphone(sample_rate=16000)
             audio_model = whisper.load_model(self.model_name, device=self.device)
 
-            transcription_buffer = ""
+            # Warm-up decode on silence: the first transcribe pays CUDA
+            # autotune and kernel compilation, better spent before capture
+            try:
+                audio_model.transcribe(
+                    np.zeros(16000, dtype=np.float32), language=self.language
+                )
+            except Exception:
+                pass
 
-            def record_callback(_, audio: sr.AudioData):
+            # Silero VAD gates transcription: clips without speech are dropped
+            # before reaching Whisper, which otherwise burns compute on them
+            # and tends to hallucinate text from silence
+            try:
+                vad_model, vad_utils = torch.hub.load("snakers4/silero-vad", "silero_vad")
+                # Keep the VAD on the transcription device; on CUDA this
+                # avoids a CPU round trip before every clip
+                if self.device == "cuda" and torch.cuda.is_available():
+                    vad_model = vad_model.to(self.device)
+                get_speech_timestamps, _, _, _, collect_chunks = vad_utils
+            except Exception as e:
+                vad_model = None
+                self.logger.log_error(f"Silero VAD unavailable, transcribing ungated: {e}")
+
+            sample_rate = 16000
+
+            # Capture goes straight from PortAudio into a preallocated
+            # float32 ring: no speech_recognition AudioData wrappers, no
+            # int16 round trip, no Python-level energy VAD. The callback is
+            # the only writer and this thread the only reader, so the two
+            # monotonic counters need no lock.
+            ring = np.empty(sample_rate * 30, dtype=np.float32)
+            cap = ring.shape[0]
+            write_count = 0
+
+            def audio_callback(indata, frames, time_info, status):
+                nonlocal write_count
                 if not self.running:
                     return
+                mono = indata[:, 0]
+                pos = write_count % cap
+                end = pos + mono.shape[0]
+                if end <= cap:
+                    ring[pos:end] = mono
+                else:
+                    first = cap - pos
+                    ring[pos:] = mono[:first]
+                    ring[: end - cap] = mono[first:]
+                write_count += mono.shape[0]
 
-                data = audio.get_raw_data()
-                audio_np = np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
+            # Utterance assembles in place; Silero decides when it ends
+            utterance = np.empty(sample_rate * 30, dtype=np.float32)
+            filled = 0
+            read_count = 0
+            in_speech = False
+            probe = sample_rate // 2  # newest window the VAD probes per poll
+
+            def flush():
+                nonlocal filled, in_speech
+                audio_np = utterance[:filled]
+                if vad_model is not None:
+                    wav = torch.from_numpy(audio_np)
+                    if self.device == "cuda" and torch.cuda.is_available():
+                        wav = wav.to(self.device, non_blocking=True)
+                    speech_ts = get_speech_timestamps(
+                        wav, vad_model,
+                        sampling_rate=sample_rate,
+                        threshold=self.vad_threshold,
+                        min_silence_duration_ms=100,
+                    )
+                    if not speech_ts:
+                        filled = 0
+                        in_speech = False
+                        return
+                    # Transcribe only the detected speech spans
+                    audio_np = collect_chunks(speech_ts, wav).cpu().numpy()
                 result = audio_model.transcribe(audio_np, language=self.language, fp16=torch.cuda.is_available())
                 text = result['text'].strip()
                 if text:
                     self.transcription_signal.emit(text)
+                filled = 0
+                in_speech = False
 
-            with source:
-                recorder.adjust_for_ambient_noise(source)
-            stop_listening = recorder.listen_in_background(source, record_callback, phrase_time_limit=self.record_timeout)
+            with sd.InputStream(
+                samplerate=sample_rate,
+                channels=1,
+                dtype="float32",
+                blocksize=sample_rate // 10,
+                callback=audio_callback,
+            ):
+                while self.running:
+                    avail = write_count - read_count
+                    if avail <= 0:
+                        self.msleep(100)
+                        continue
 
-            while self.running:
-                self.msleep(100)
+                    # Drain the ring into the utterance buffer
+                    n = min(avail, utterance.shape[0] - filled)
+                    pos = read_count % cap
+                    end = pos + n
+                    if end <= cap:
+                        utterance[filled:filled + n] = ring[pos:end]
+                    else:
+                        first = cap - pos
+                        utterance[filled:filled + first] = ring[pos:]
+                        utterance[filled + first:filled + n] = ring[: end - cap]
+                    read_count += n
+                    filled += n
+
+                    if vad_model is not None:
+                        # Probe only the newest window; the whole utterance
+                        # gets VAD-trimmed once at flush time
+                        tail = utterance[max(0, filled - probe):filled]
+                        wav = torch.from_numpy(tail)
+                        if self.device == "cuda" and torch.cuda.is_available():
+                            wav = wav.to(self.device, non_blocking=True)
+                        speech_ts = get_speech_timestamps(
+                            wav, vad_model,
+                            sampling_rate=sample_rate,
+                            threshold=self.vad_threshold,
+                            min_silence_duration_ms=100,
+                        )
+                        if speech_ts and filled < utterance.shape[0]:
+                            in_speech = True
+                        elif in_speech:
+                            # Trailing silence (or a full buffer) ends the turn
+                            flush()
+                        else:
+                            # Leading silence: keep just the probe tail so the
+                            # next utterance's onset is not clipped
+                            keep = min(filled, probe)
+                            utterance[:keep] = utterance[filled - keep:filled]
+                            filled = keep
+                    elif (
+                        filled >= int(self.record_timeout * sample_rate)
+                        or filled >= utterance.shape[0]
+                    ):
+                        # Ungated fallback: flush on the record timeout
+                        flush()
+
+                    self.msleep(100)
 
-            stop_listening()
             self.logger.log_info("Whisper Transcription Thread Stopped")
         except Exception as e:
             self.logger.log_error(f"Error in Whisper Transcription Thread: {e}")
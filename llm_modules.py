@@ -3,17 +3,26 @@ from PySide6.QtCore import QThread, Signal, Slot
 from openai import OpenAI, OpenAIError
 from PySide6.QtCore import QMetaObject, Qt
 from queue import Queue
+import httpx
 import openai
 from ollama import chat
 class OpenAIWorker(QObject):
     responseReady = Signal(str)
+    partialResponse = Signal(str)
     errorOccurred = Signal(str)
 
     def __init__(self, api_key, parent=None):
         super(OpenAIWorker, self).__init__(parent)
         self.api_key = api_key
         openai.api_key = self.api_key
-        self.openai_client = OpenAI(api_key=self.api_key)
+        # Pin one long-lived connection pool for all requests, so the TLS
+        # handshake is paid once instead of whenever the default client's
+        # keepalive expires between utterances
+        self._http_client = httpx.Client(
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+        self.openai_client = OpenAI(api_key=self.api_key, http_client=self._http_client)
         self.request_queue = Queue()
         self.is_processing = False
         self.should_exit = False  # Shutdown flag
@@ -33,16 +42,26 @@ class OpenAIWorker(QObject):
         try:
             if self.should_exit:
                 return
-            response = self.openai_client.chat.completions.create(
+            # Stream tokens as they arrive: partialResponse lets the UI show
+            # text at first-token latency, while responseReady still delivers
+            # the complete message for the context history and TTS
+            stream = self.openai_client.chat.completions.create(
                 model=model,
                 messages=context,
                 max_tokens=max_tokens,
                 temperature=temperature,
-                timeout=10  # Timeout in seconds
+                timeout=10,  # Timeout in seconds
+                stream=True,
             )
-            if self.should_exit:
-                return
-            assistant_message = response.choices[0].message.content.strip()
+            parts = []
+            for chunk in stream:
+                if self.should_exit:
+                    return
+                if chunk.choices and chunk.choices[0].delta.content:
+                    delta = chunk.choices[0].delta.content
+                    parts.append(delta)
+                    self.partialResponse.emit(delta)
+            assistant_message = "".join(parts).strip()
             self.responseReady.emit(assistant_message)
         except Exception as e:
             if not self.should_exit:
@@ -68,6 +87,7 @@ class OpenAIWorker(QObject):
 
 class OllamaWorker(QObject):
     responseReady = Signal(str)
+    partialResponse = Signal(str)
     errorOccurred = Signal(str)
 
     def __init__(self, model_name="llama3.2", parent=None):
@@ -116,7 +136,10 @@ class OllamaWorker(QObject):
                           options={"temperature":temperature, "num_predict":max_tokens })
 
             for chunk in stream:
-                response_content += chunk['message']['content']
+                delta = chunk['message']['content']
+                if delta:
+                    response_content += delta
+                    self.partialResponse.emit(delta)
 
             # Emit the final assistant message
             self.responseReady.emit(response_content)
@@ -3,7 +3,8 @@ import os
 import speech_recognition as sr
 import openai
 from PySide6.QtWidgets import QApplication, QMainWindow, QMessageBox, QPushButton, QLineEdit, QFileDialog
-from PySide6.QtCore import QThread, Signal, Slot
+from PySide6.QtCore import QThread, QTimer, Signal, Slot
+from PySide6.QtGui import QTextCursor
 from ui_form import Ui_MainWindow
 from local_logger import ThreadSafeLogger
 from pathlib import Path
@@ -13,6 +14,33 @@ from llm_modules import OpenAIWorker, OllamaWorker
 from tts_modules import TTSWorker, GoogleTTSEngine, CoquiTTSEngine
 from asr_vad_modules import WhisperTranscriptionThread, GoogleASRTranscriptionThread
 #from behaviour_module import Audio2FaceHeadlessThread
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _whisper_languages():
+    """Memoized Whisper language map; the import pulls in all of whisper."""
+    from whisper.tokenizer import LANGUAGES
+    return LANGUAGES
+
+
+class _ComboLoader(QThread):
+    """Run a blocking loader callable off the GUI thread.
+
+    The result (or the exception) comes back through a queued signal, so
+    the receiving slot runs on the GUI thread and can touch widgets.
+    """
+    loaded = Signal(object)
+
+    def __init__(self, loader, parent=None):
+        super().__init__(parent)
+        self._loader = loader
+
+    def run(self):
+        try:
+            self.loaded.emit(self._loader())
+        except Exception as e:
+            self.loaded.emit(e)
 
 
 class MainWindow(QMainWindow):
@@ -61,6 +89,7 @@ class MainWindow(QMainWindow):
         #self.openai_worker_thread = None
         self.llm_worker = None
         self.llm_worker_thread = None
+        self._streaming_reply = False
         self.transcription_thread = None
         self.tts_worker = None
         self.MAX_CONTEXT_LENGTH = 50
@@ -69,8 +98,22 @@ class MainWindow(QMainWindow):
         # Setup UI
         # ----------------------------------------------------
         self.setup_ui()
-        self.populate_microphones()
-        self.populate_languages()
+        # Microphone enumeration walks every PortAudio device synchronously
+        # and the whisper.tokenizer import drags in all of whisper (torch,
+        # CUDA checks) -- seconds on a cold interpreter. Both run on loader
+        # threads so the window paints immediately; the combos show
+        # placeholders until the queued signals fill them in.
+        self.ui.microphoneMBox.addItem("Detecting microphones...")
+        self._mic_loader = _ComboLoader(sr.Microphone.list_microphone_names, self)
+        self._mic_loader.loaded.connect(self.populate_microphones)
+        self._mic_loader.start()
+
+        self.ui.whisperLanguage.addItem("Loading languages...")
+        self._lang_loader = _ComboLoader(_whisper_languages, self)
+        self._lang_loader.loaded.connect(self.populate_languages)
+        self._lang_loader.start()
+
+        self.populate_google_languages()
 
         # Initialize system prompt if empty
         # system_prompt_text = self.ui.systemPromptEdit.toPlainText().strip()
@@ -273,23 +316,26 @@ class MainWindow(QMainWindow):
     # ----------------------------------------------------
     # Microphone & Language
     # ----------------------------------------------------
-    def populate_microphones(self):
-        try:
-            mic_list = sr.Microphone.list_microphone_names()
-            self.ui.microphoneMBox.clear()
-            if mic_list:
-                self.ui.microphoneMBox.addItems(mic_list)
-            else:
-                self.ui.microphoneMBox.addItem("No microphones detected")
-        except Exception as e:
-            self.ui.microphoneMBox.addItem(f"Error: {e}")
+    @Slot(object)
+    def populate_microphones(self, mic_list):
+        self.ui.microphoneMBox.clear()
+        if isinstance(mic_list, Exception):
+            self.ui.microphoneMBox.addItem(f"Error: {mic_list}")
+        elif mic_list:
+            self.ui.microphoneMBox.addItems(mic_list)
+        else:
+            self.ui.microphoneMBox.addItem("No microphones detected")
 
-    def populate_languages(self):
-        from whisper.tokenizer import LANGUAGES
+    @Slot(object)
+    def populate_languages(self, languages):
         self.ui.whisperLanguage.clear()
-        for lang_name, lang_key in LANGUAGES.items():
+        if isinstance(languages, Exception):
+            self.ui.whisperLanguage.addItem(f"Error: {languages}")
+            return
+        for lang_name, lang_key in languages.items():
             self.ui.whisperLanguage.addItem(lang_name, lang_key)
 
+    def populate_google_languages(self):
         self.ui.googleLanguage.clear()
         google_languages = ["en-US", "es-ES", "fr-FR", "de-DE"]
         self.ui.googleLanguage.addItems(google_languages)
@@ -468,6 +514,7 @@ class MainWindow(QMainWindow):
         self.llm_worker = OpenAIWorker(api_key=self.api_key)
         self.llm_worker_thread = QThread()
         self.llm_worker.moveToThread(self.llm_worker_thread)
+        self.llm_worker.partialResponse.connect(self.append_llm_partial)
         self.llm_worker.responseReady.connect(self.display_llm_response)
         self.llm_worker.errorOccurred.connect(self.display_llm_error)
 
@@ -491,6 +538,7 @@ class MainWindow(QMainWindow):
         self.llm_worker = OllamaWorker(model_name="llama3.2")
         self.llm_worker_thread = QThread()
         self.llm_worker.moveToThread(self.llm_worker_thread)
+        self.llm_worker.partialResponse.connect(self.append_llm_partial)
         self.llm_worker.responseReady.connect(self.display_llm_response)
         self.llm_worker.errorOccurred.connect(self.display_llm_error)
 
@@ -566,13 +614,33 @@ class MainWindow(QMainWindow):
     # LLM Response Handling
     # ----------------------------------------------------
 
+    @Slot(str)
+    def append_llm_partial(self, chunk):
+        """
+        Streams one delta of the assistant reply into the context browser as
+        it arrives, so text shows up at first-token latency instead of after
+        the whole completion.
+        """
+        browser = self.ui.contextBrowserOpenAI
+        if not self._streaming_reply:
+            self._streaming_reply = True
+            browser.append("<b>Assistant:</b> ")
+        cursor = browser.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(chunk)
+        browser.setTextCursor(cursor)
+
     @Slot(str)
     def display_llm_response(self, response):
         """
         Handles the response from the LLM (OpenAI or Ollama) and appends it to the context.
         """
         self.context.append({"role": "assistant", "content": response})
-        self.ui.contextBrowserOpenAI.append(f"<b>Assistant:</b> {response}")
+        if self._streaming_reply:
+            # The text is already in the browser from the partial chunks
+            self._streaming_reply = False
+        else:
+            self.ui.contextBrowserOpenAI.append(f"<b>Assistant:</b> {response}")
 
         # Automatically trigger TTS for the assistant response
         self.tts_request_signal.emit(response)
@@ -710,8 +778,10 @@ class MainWindow(QMainWindow):
         # Block until finish
         block_until = self.ui.blockUntilFinish.isChecked()
 
-        # Chunk + delay
-        chunk_dur = self.ui.ttsChunkDuration.value()
+        # Chunk + delay. The slider keeps its historical meaning of chunks
+        # per second; push_audio_track_stream now takes seconds, so convert
+        # (slider 10 => 100 ms chunks, as before)
+        chunk_dur = 1.0 / self.ui.ttsChunkDuration.value()
         delay_chunks = self.ui.ttsDelayBetweenChunks.value()
 
         # Now instantiate TTSWorker
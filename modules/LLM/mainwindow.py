@@ -3,9 +3,33 @@ from openai import  OpenAI, OpenAIError
 from PySide6.QtWidgets import QApplication, QMainWindow, QMessageBox
 from ui_form import Ui_MainWindow  # Assuming the UI file is converted to a Python file named `ui_form.py`
 import os
-from PySide6.QtCore import QFile, QIODevice
+from PySide6.QtCore import QFile, QIODevice, QSignalBlocker
 from pathlib import Path
-from PySide6.QtGui import QFont
+from PySide6.QtGui import QFont, QTextCursor
+from dataclasses import dataclass
+
+# Cached role -> display-name mapping so refreshing the context browser is a
+# dict lookup per entry instead of a str.capitalize() call per entry.
+_ROLE_DISPLAY = {
+    "user": "User",
+    "assistant": "Assistant",
+    "system": "System",
+    "developer": "Developer",
+}
+
+
+@dataclass(slots=True)
+class Msg:
+    """A single chat turn; slotted so long conversation histories stay lightweight."""
+    role: str
+    content: str
+
+
+def _to_openai_messages(context):
+    """Convert Msg entries to the dict format the OpenAI client expects."""
+    return [{"role": m.role, "content": m.content} for m in context]
+
+
 class MainWindow(QMainWindow):
     # macros
     API_MESSAGE_DEFAULT = "Enter here or set as OPENAI_API_KEY variable"
@@ -25,7 +49,7 @@ class MainWindow(QMainWindow):
         # Initialize OpenAI settings
         #self.API_MESSAGE = "Enter here or set as OPENAI_API_KEY variable"
         self.api_key = self.API_MESSAGE_DEFAULT
-        self.context = [{"role": "system", "content": "You are a helpful assistant."}]
+        self.context = [Msg("system", "You are a helpful assistant.")]
         self.models = ["gpt-4o-mini", "gpt-3.5-turbo"]  # Add more models as required
 
         # Populate model combo box
@@ -38,6 +62,17 @@ class MainWindow(QMainWindow):
         self.system_prompt = None
         self.context = None
 
+        # Cached OpenAI client: only re-resolve the key (widget text + env
+        # lookup) when the key field actually changes, not on every send.
+        self.openai_client = None
+        self._key_dirty = True
+        self.ui.openaiAPIKey.textChanged.connect(self._mark_key_dirty)
+
+        # Persistent cursor at the end of the context browser so new messages
+        # can be inserted in place instead of re-setting the whole transcript.
+        self._context_cursor = self.ui.contextBrowserOpenAI.textCursor()
+        self._context_cursor.movePosition(QTextCursor.End)
+
         # Hide chat-related widgets initially
         self.ui.groupBoxChat.hide()
         #self.ui.contextTextBrowser.hide()
@@ -53,9 +88,12 @@ class MainWindow(QMainWindow):
         """
         Setup theme selection combobox and populate it with available stylesheets.
         """
-        self.ui.themeComboBox.clear()
         themes = self.get_available_themes()
-        self.ui.themeComboBox.addItems(themes)
+        # Block signals while repopulating so currentIndexChanged doesn't fire
+        # apply_selected_theme (a full restyle) for every intermediate item.
+        with QSignalBlocker(self.ui.themeComboBox):
+            self.ui.themeComboBox.clear()
+            self.ui.themeComboBox.addItems(themes)
 
         # Connect the combo box selection event to apply the selected theme
         self.ui.themeComboBox.currentIndexChanged.connect(self.apply_selected_theme)
@@ -80,9 +118,18 @@ class MainWindow(QMainWindow):
 
         if stylesheet_path.exists():
             try:
-                with stylesheet_path.open("r", encoding="utf-8") as file:
-                    stylesheet = file.read()
-                    self.setStyleSheet(stylesheet)
+                # Memory-map the stylesheet via QFile instead of a Python-level
+                # read() so the bytes are decoded once straight from the map.
+                qss_file = QFile(str(stylesheet_path))
+                if not qss_file.open(QIODevice.ReadOnly):
+                    raise IOError(qss_file.errorString())
+                mapped = qss_file.map(0, qss_file.size())
+                try:
+                    stylesheet = bytes(mapped).decode("utf-8")
+                finally:
+                    qss_file.unmap(mapped)
+                    qss_file.close()
+                self.setStyleSheet(stylesheet)
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Failed to apply theme {theme_name}. Error: {e}")
         else:
@@ -95,7 +142,18 @@ class MainWindow(QMainWindow):
         selected_theme = self.ui.themeComboBox.currentText()
         self.apply_stylesheet_file(selected_theme)
 
+    def _mark_key_dirty(self):
+        """Flag the cached OpenAI client as stale when the key field changes."""
+        self._key_dirty = True
+
     def initialise_openai(self):
+        if not self._key_dirty and self.openai_client is not None:
+            # Key unchanged since the last send; reuse the cached client.
+            if self.context is None:
+                self.system_prompt = self.ui.systemPromptEdit.toPlainText().strip()
+                self.context = [Msg("system", self.system_prompt)]
+            return
+
         self.api_key = self.ui.openaiAPIKey.text().strip()
 
         if not self.api_key or self.api_key in [self.API_MESSAGE_DEFAULT, self.API_MESSAGE_FOUND_ENV]:
@@ -108,11 +166,12 @@ class MainWindow(QMainWindow):
                 return
 
         self.openai_client = OpenAI(api_key=self.api_key)
+        self._key_dirty = False
 
 
         if self.context is None:
             self.system_prompt = self.ui.systemPromptEdit.toPlainText().strip()
-            self.context = [{"role": "system", "content": self.system_prompt}]
+            self.context = [Msg("system", self.system_prompt)]
 
     def test_connection(self):
         """
@@ -124,10 +183,10 @@ class MainWindow(QMainWindow):
         try:
 
             # Test connection with a simple "Hello"
-            self.context.append({"role": "user", "content": "Hello"})
+            self.context.append(Msg("user", "Hello"))
             response = self.openai_client.chat.completions.create(
                 model=model,
-                messages= self.context,
+                messages=_to_openai_messages(self.context),
                 max_tokens=10
             )
             assistant_message = response.choices[0].message.content.strip()
@@ -142,12 +201,17 @@ class MainWindow(QMainWindow):
         #self.api_key = os.getenv('OPENAI_API_KEY') or "enter your api"
 
         #self.ui.systemPromptEdit.setText("You are a helpful assistant")
-        #self.context = [{"role": "system", "content": self.system_prompt}]
-        self.ui.temperatureOpenAI.setValue(70)
-        self.ui.maxTokenOpenAI.setValue(1024)
-        self.ui.contextBrowserOpenAI.clear()
-        self.ui.llmMBOX.setCurrentText("gpt-4o-mini")
-        self.context = [{"role": "system", "content": self.system_prompt}]
+        #self.context = [Msg("system", self.system_prompt)]
+        # Bulk widget reset: block per-widget change signals so the reset costs
+        # one update per widget instead of one update per connected handler.
+        with QSignalBlocker(self.ui.temperatureOpenAI), \
+             QSignalBlocker(self.ui.maxTokenOpenAI), \
+             QSignalBlocker(self.ui.llmMBOX):
+            self.ui.temperatureOpenAI.setValue(70)
+            self.ui.maxTokenOpenAI.setValue(1024)
+            self.ui.llmMBOX.setCurrentText("gpt-4o-mini")
+        self.context = [Msg("system", self.system_prompt)]
+        self.update_context_browser()
 
         QMessageBox.information(self, "Defaults Reset", "All settings have been reset to defaults.")
 
@@ -158,8 +222,11 @@ class MainWindow(QMainWindow):
         if self.system_prompt is None:
             self.initialise_openai()
         else:
-            self.context = [{"role": "system", "content": self.system_prompt}]
-            self.ui.contextBrowserOpenAI.clear()
+            self.context = [Msg("system", self.system_prompt)]
+        # initialise_openai can bail without a context when the API key is
+        # missing; only rebuild the browser when there is one to show
+        if self.context is not None:
+            self.update_context_browser()
         QMessageBox.information(self, "Context Reset", "Conversation context has been reset.")
 
     def toggle_chat_mode(self, state):
@@ -174,12 +241,23 @@ class MainWindow(QMainWindow):
 
     def update_context_browser(self):
         """
-        Update the context text browser with the current conversation history.
+        Rebuild the context text browser from the full conversation history.
+        Only needed after a reset; new messages go through append_to_context_browser.
         """
         formatted_context = "\n".join(
-            f"{entry['role'].capitalize()}: {entry['content']}" for entry in self.context
+            f"{_ROLE_DISPLAY[m.role]}: {m.content}" for m in self.context
         )
         self.ui.contextBrowserOpenAI.setText(formatted_context)
+        self._context_cursor.movePosition(QTextCursor.End)
+
+    def append_to_context_browser(self, entry):
+        """
+        Insert a single message at the end of the context browser via the
+        persistent cursor, avoiding a full document re-layout per message.
+        """
+        self._context_cursor.movePosition(QTextCursor.End)
+        self._context_cursor.insertText(f"{_ROLE_DISPLAY[entry.role]}: {entry.content}\n")
+        self.ui.contextBrowserOpenAI.ensureCursorVisible()
 
     def send_user_input(self):
         """
@@ -192,9 +270,9 @@ class MainWindow(QMainWindow):
             return
 
         # Add user input to context
-        self.context.append({"role": "user", "content": user_input})
+        self.context.append(Msg("user", user_input))
         self.ui.userInputOpenAI.clear()
-        self.update_context_browser()
+        self.append_to_context_browser(self.context[-1])
 
         model = self.ui.llmMBOX.currentText()
         temperature = self.ui.temperatureOpenAI.value() / 100.0
@@ -204,13 +282,13 @@ class MainWindow(QMainWindow):
             # Send to OpenAI
             response = self.openai_client.chat.completions.create(
                 model=model,
-                messages=self.context,
+                messages=_to_openai_messages(self.context),
                 max_tokens=max_tokens,
                 temperature=temperature
             )
             assistant_message = response.choices[0].message.content.strip()
-            self.context.append({"role": "assistant", "content": assistant_message})
-            self.update_context_browser()
+            self.context.append(Msg("assistant", assistant_message))
+            self.append_to_context_browser(self.context[-1])
         except Exception as e:
             QMessageBox.critical(self, "OpenAI Error", f"Failed to get a response. Error: {e}")
 
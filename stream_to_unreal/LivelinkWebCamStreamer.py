@@ -7,15 +7,62 @@ import socket
 import struct
 import numpy as np
 import math
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Pre-compiled length-prefix packer shared by every outgoing frame
+_HDR = struct.Struct("!Q")
 
 class LiveLinkWebcamStreamer:
-    def __init__(self, remote_address, blendshape_port):
+    def __init__(self, remote_address, blendshape_port, use_binary_framing=False, show_preview=True):
         self.remote_address = remote_address
         self.blendshape_port = blendshape_port
+        # Opt-in binary framing for receivers that support it: ~10x smaller
+        # payloads than JSON and no float->decimal formatting per frame.
+        self.use_binary_framing = use_binary_framing
+        # Preview window is for debugging; disable it when streaming headless
+        # to skip the imshow blit and the ~1ms waitKey stall per frame.
+        self.show_preview = show_preview
         self.blendshape_socket = None
         self.capture = cv2.VideoCapture(0)  # Initialize webcam
+        # Keep only the freshest frame in the driver queue; default backends
+        # buffer ~4 frames, which adds ~100ms of latency at 30fps.
+        if not self.capture.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+            print("Warning: backend ignored CAP_PROP_BUFFERSIZE, frames may be stale")
+        # The camera FPS never changes; probe it once instead of per frame
+        self._fps = int(self.capture.get(cv2.CAP_PROP_FPS)) or 30
         self.frame_index = 0
 
+        # Required blendshape names in the order the receiver expects; the last
+        # three entries are the head pose channels filled in separately.
+        self._required_names = (
+            "eyeblinkleft", "eyelookdownleft", "eyelookinleft", "eyelookoutleft", "eyelookupleft",
+            "eyesquintleft", "eyewideleft", "eyeblinkright", "eyelookdownright", "eyelookinright",
+            "eyelookoutright", "eyelookupright", "eyesquintright", "eyewideright", "jawforward",
+            "jawleft", "jawright", "jawopen", "mouthclose", "mouthfunnel", "mouthpucker",
+            "mouthleft", "mouthright", "mouthsmileleft", "mouthsmileright", "mouthfrownleft",
+            "mouthfrownright", "mouthdimpleleft", "mouthdimpleright", "mouthstretchleft",
+            "mouthstretchright", "mouthrolllower", "mouthrollupper", "mouthshruglower",
+            "mouthshrugupper", "mouthpressleft", "mouthpressright", "mouthlowerdownleft",
+            "mouthlowerdownright", "mouthupperupleft", "mouthupperupright", "browdownleft",
+            "browdownright", "browinnerup", "browouterupleft", "browouterupright", "cheekpuff",
+            "cheeksquintleft", "cheeksquintright", "nosesneerleft", "nosesneerright", "tongueout",
+            "headroll", "headpitch", "headyaw"
+        )
+        # The names block never changes; serialize it once instead of per frame
+        self._names_json = json.dumps(list(self._required_names), separators=(',', ':'))
+        # Binary frame layout: !Q payload length, !I frame index, one f per weight.
+        # Pre-compiled so pack() skips format parsing on every frame.
+        self._binary_packer = struct.Struct(f"!QI{len(self._required_names)}f")
+        # Lowercased category name -> index, cached from the first result since
+        # MediaPipe's blendshape set and ordering are fixed across frames
+        self._mp_index_for = None
+        # RGB conversion buffers, sized once from the first captured frame;
+        # double-buffered because detect_async may still read the previous
+        # frame while the next conversion is written
+        self._rgb_bufs = None
+
         self.init_socket()
         self.init_face_landmarker()
 
@@ -25,105 +72,105 @@ class LiveLinkWebcamStreamer:
         server_address = (self.remote_address, self.blendshape_port)
         print(f"Connecting to {server_address[0]} port {server_address[1]} for blendshape data")
         self.blendshape_socket.connect(server_address)
+        # Per-frame payloads are small; disable Nagle so they go out immediately
+        self.blendshape_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
     def init_face_landmarker(self):
-        """Initialize the Mediapipe FaceLandmarker."""
+        """Initialize the Mediapipe FaceLandmarker in LIVE_STREAM mode.
+
+        Async detection decouples inference from capture, so the loop keeps
+        grabbing frames while the model runs and results arrive via callback.
+        """
         base_options = python.BaseOptions(model_asset_path='face_landmarker_v2_with_blendshapes.task')
         options = vision.FaceLandmarkerOptions(
             base_options=base_options,
             output_face_blendshapes=True,
             output_facial_transformation_matrixes=True,
-            num_faces=1
+            num_faces=1,
+            running_mode=vision.RunningMode.LIVE_STREAM,
+            result_callback=self._on_result
         )
         self.detector = vision.FaceLandmarker.create_from_options(options)
 
     def send_data(self, data):
-        """Send data to the socket."""
-        json_data = json.dumps(data, separators=(',', ':'))
-        verify_size = struct.pack("!Q", len(json_data))
-        print(json_data)
-        self.blendshape_socket.sendall(verify_size + bytes(json_data, 'ascii'))
+        """Serialize and send data to the socket."""
+        self.send_json(json.dumps(data, separators=(',', ':')))
+
+    def send_json(self, json_data):
+        """Frame an already-serialized JSON payload and send it in one write."""
+        logger.debug('%s', json_data)
+        self.blendshape_socket.sendall(_HDR.pack(len(json_data)) + bytes(json_data, 'ascii'))
 
     def decompose44(self, A44):
-        """Decompose 4x4 transformation matrix into translation, rotation, scaling, and shears."""
+        """Decompose 4x4 transformation matrix into translation, rotation, scaling, and shears.
+
+        The Gram-Schmidt orthogonalization is a QR factorization of the upper-left
+        3x3 block, so a single LAPACK call replaces the former scalar loop.
+        """
         A44 = np.asarray(A44)
         T = A44[:-1, -1]
         RZS = A44[:-1, :-1]
-        # Compute scales and shears
-        M0, M1, M2 = np.array(RZS).T
-        # Extract x scale and normalize
-        sx = math.sqrt(np.sum(M0**2))
-        M0 /= sx
-        # Orthogonalize M1 with respect to M0
-        sx_sxy = np.dot(M0, M1)
-        M1 -= sx_sxy * M0
-        # Extract y scale and normalize
-        sy = math.sqrt(np.sum(M1**2))
-        M1 /= sy
-        sxy = sx_sxy / sx
-        # Orthogonalize M2 with respect to M0 and M1
-        sx_sxz = np.dot(M0, M2)
-        sy_syz = np.dot(M1, M2)
-        M2 -= (sx_sxz * M0 + sy_syz * M1)
-        # Extract z scale and normalize
-        sz = math.sqrt(np.sum(M2**2))
-        M2 /= sz
-        sxz = sx_sxz / sx
-        syz = sy_syz / sy
-        # Reconstruct rotation matrix, ensure positive determinant
-        Rmat = np.array([M0, M1, M2]).T
+        Rmat, upper = np.linalg.qr(RZS)
+        # QR leaves the scale signs on the diagonal of the triangular factor;
+        # fold them into the rotation so scales come out positive
+        signs = np.sign(np.diag(upper))
+        signs[signs == 0] = 1.0
+        Rmat = Rmat * signs
+        upper = upper * signs[:, None]
+        sx, sy, sz = np.diag(upper)
+        # Shears normalized by the scales, matching the previous scalar output
+        sxy = upper[0, 1] / sx
+        sxz = upper[0, 2] / sx
+        syz = upper[1, 2] / sy
+        # Ensure positive determinant
         if np.linalg.det(Rmat) < 0:
-            sx *= -1
+            sx = -sx
             Rmat[:, 0] *= -1
         return T, Rmat, np.array([sx, sy, sz]), np.array([sxy, sxz, syz])
 
     def extract_head_pose(self, transformation_matrix):
-        """Extract HeadRoll, HeadPitch, and HeadYaw from the transformation matrix using decomposition."""
-        _, Rmat, _, _ = self.decompose44(transformation_matrix)
-        pitch = math.atan2(Rmat[2, 1], Rmat[2, 2])  # Rotation around X-axis
-        yaw = math.asin(-Rmat[2, 0])            # Rotation around Y-axis
-        roll = math.atan2(Rmat[1, 0], Rmat[0, 0])  # Rotation around Z-axis
+        """Extract HeadRoll, HeadPitch, and HeadYaw directly from the rotation block.
+
+        The MediaPipe facial transformation matrix is a rigid transform with unit
+        scale, so the full decompose44 (Gram-Schmidt, square roots, determinant
+        check) is unnecessary per frame; the 3x3 block already is the rotation.
+        """
+        Rmat = np.asarray(transformation_matrix)
+        # Unbox the five needed elements to plain floats up front; math.* on
+        # numpy scalars pays a conversion per call otherwise
+        r20, r21, r22 = float(Rmat[2, 0]), float(Rmat[2, 1]), float(Rmat[2, 2])
+        r10, r00 = float(Rmat[1, 0]), float(Rmat[0, 0])
+        pitch = math.atan2(r21, r22)  # Rotation around X-axis
+        yaw = math.asin(max(-1.0, min(1.0, -r20)))  # Rotation around Y-axis
+        roll = math.atan2(r10, r00)  # Rotation around Z-axis
         return roll, -pitch, -yaw
 
     def process_frame(self, frame):
-        """Process a single video frame to extract blendshapes and transformation matrices."""
+        """Hand a single video frame to the landmarker for async detection."""
         mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=frame)
-        detection_result = self.detector.detect(mp_image)
+        timestamp_ms = self.frame_index * 1000 // self._fps
+        self.detector.detect_async(mp_image, timestamp_ms)
 
+    def _on_result(self, detection_result, image, timestamp_ms):
+        """Extract blendshapes/head pose from an async detection result and send them."""
         if detection_result.face_blendshapes:
             blendshapes = detection_result.face_blendshapes[0]
 
-            # Extract blendshape names and scores
-            face_blendshapes_names = [face_blendshapes_category.category_name.lower() for face_blendshapes_category in
-                                      blendshapes]
-            face_blendshapes_scores = [face_blendshapes_category.score for face_blendshapes_category in
-                                       blendshapes]
-
-            # Required blendshape names
-            required_names = [
-                "eyeblinkleft", "eyelookdownleft", "eyelookinleft", "eyelookoutleft", "eyelookupleft",
-                "eyesquintleft", "eyewideleft", "eyeblinkright", "eyelookdownright", "eyelookinright",
-                "eyelookoutright", "eyelookupright", "eyesquintright", "eyewideright", "jawforward",
-                "jawleft", "jawright", "jawopen", "mouthclose", "mouthfunnel", "mouthpucker",
-                "mouthleft", "mouthright", "mouthsmileleft", "mouthsmileright", "mouthfrownleft",
-                "mouthfrownright", "mouthdimpleleft", "mouthdimpleright", "mouthstretchleft",
-                "mouthstretchright", "mouthrolllower", "mouthrollupper", "mouthshruglower",
-                "mouthshrugupper", "mouthpressleft", "mouthpressright", "mouthlowerdownleft",
-                "mouthlowerdownright", "mouthupperupleft", "mouthupperupright", "browdownleft",
-                "browdownright", "browinnerup", "browouterupleft", "browouterupright", "cheekpuff",
-                "cheeksquintleft", "cheeksquintright", "nosesneerleft", "nosesneerright", "tongueout",
-                "headroll", "headpitch", "headyaw"
+            # Map Mediapipe blendshapes to the required order. The name->index
+            # mapping is built once on the first result; after that each frame
+            # only collects the raw scores and reads them positionally.
+            if self._mp_index_for is None:
+                self._mp_index_for = {
+                    c.category_name.lower(): i for i, c in enumerate(blendshapes)
+                }
+            scores = [c.score for c in blendshapes]
+            index_for = self._mp_index_for
+            # Exclude HeadRoll, HeadPitch, HeadYaw; non-matching names get 0.0
+            weights = [
+                scores[index_for[name]] if name in index_for else 0.0
+                for name in self._required_names[:-3]
             ]
 
-            # Map Mediapipe blendshapes to required format, ignoring non-matching names
-            weights = []
-            for name in required_names[:-3]:  # Exclude HeadRoll, HeadPitch, HeadYaw
-                if name in face_blendshapes_names:
-                    index = face_blendshapes_names.index(name)
-                    weights.append(face_blendshapes_scores[index])
-                else:
-                    weights.append(0.0)
-
             # Add head poses
             head_roll, head_pitch, head_yaw = 0, 0, 0
             if detection_result.facial_transformation_matrixes:
@@ -132,20 +179,26 @@ class LiveLinkWebcamStreamer:
                 )
             weights += [head_roll, head_pitch, head_yaw]
 
-            data = {
-                "Audio2Face": {
-                    "Body": {},
-                    "Facial": {
-                        "Names": required_names,
-                        "Weights": weights
-                    },
-                    "FrameTiming": {
-                        "FPS": int(self.capture.get(cv2.CAP_PROP_FPS)) or 30,
-                        "Index": self.frame_index
-                    }
-                }
-            }
-            self.send_data(data)
+            if self.use_binary_framing:
+                self.blendshape_socket.sendall(
+                    self._binary_packer.pack(
+                        self._binary_packer.size - 8, self.frame_index, *weights
+                    )
+                )
+                return
+
+            # Only the weights and frame index change per frame, so just the
+            # weights list is serialized here; the names block is pre-encoded.
+            payload = (
+                '{"Audio2Face":{"Body":{},"Facial":{"Names":%s,"Weights":%s},'
+                '"FrameTiming":{"FPS":%d,"Index":%d}}}' % (
+                    self._names_json,
+                    json.dumps(weights, separators=(',', ':')),
+                    self._fps,
+                    self.frame_index,
+                )
+            )
+            self.send_json(payload)
 
     def run(self):
         """Run the main loop for capturing webcam frames and processing."""
@@ -155,22 +208,32 @@ class LiveLinkWebcamStreamer:
                 print("Failed to capture frame")
                 break
 
-            # Convert frame to RGB for Mediapipe
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            self.process_frame(frame_rgb)
-
-            # Display the frame
-            cv2.imshow("Webcam", frame)
+            # Convert frame to RGB for Mediapipe into one of two persistent
+            # buffers (alternating per frame), so the loop allocates no
+            # full-size images after the first iteration
+            if self._rgb_bufs is None:
+                self._rgb_bufs = (np.empty_like(frame), np.empty_like(frame))
+            rgb_buf = self._rgb_bufs[self.frame_index & 1]
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+            self.process_frame(rgb_buf)
+
+            if self.show_preview:
+                # Display every other frame; the preview is diagnostic only and
+                # half-rate redraws cut the GUI overhead without visible lag
+                if self.frame_index % 2 == 0:
+                    cv2.imshow("Webcam", frame)
+
+                # Break on 'q' key press
+                if cv2.waitKey(1) & 0xFF == ord('q'):
+                    self.frame_index += 1
+                    break
 
             # Increment frame index
             self.frame_index += 1
 
-            # Break on 'q' key press
-            if cv2.waitKey(1) & 0xFF == ord('q'):
-                break
-
         self.capture.release()
-        cv2.destroyAllWindows()
+        if self.show_preview:
+            cv2.destroyAllWindows()
 
     def close(self):
         """Close the socket connection."""
@@ -1,9 +1,16 @@
+import functools
 import tkinter as tk
 from tkinter import ttk
 import json
+import logging
 import socket
 import struct
 
+logger = logging.getLogger(__name__)
+
+# Pre-compiled length-prefix packer shared by every outgoing frame
+_HDR = struct.Struct("!Q")
+
 class LiveLinkController:
     def __init__(self, json_file_path, remote_address, blendshape_port):
         self.json_file_path = json_file_path
@@ -13,6 +20,11 @@ class LiveLinkController:
         self.blendshape_socket = None
         self.send_mode = "Both"  # Default send mode
 
+        # Coalesce rapid slider events into one send per UI tick
+        self._flush_after_id = None
+        self._body_dirty = False
+        self._face_dirty = False
+
         self.init_socket()
         self.root = tk.Tk()
         self.root.title("LiveLink Controller")
@@ -34,9 +46,8 @@ class LiveLinkController:
     def send_data(self, data):
         """Send data to the socket."""
         json_data = json.dumps(data, separators=(',', ':'))
-        verify_size = struct.pack("!Q", len(json_data))
-        print(json_data)
-        self.blendshape_socket.sendall(verify_size + bytes(json_data, 'ascii'))
+        logger.debug('%s', json_data)
+        self.blendshape_socket.sendall(_HDR.pack(len(json_data)) + bytes(json_data, 'ascii'))
 
     def create_ui(self):
         """Create the UI with sliders for Body and Face values."""
@@ -103,15 +114,21 @@ class LiveLinkController:
             group_frame = ttk.LabelFrame(grid_frame, text=entry['Name'])
             group_frame.grid(row=index // 4, column=index % 4, padx=5, pady=5, sticky="nsew")
 
+            # Build each group in one grid pass: gridding every child once is
+            # one geometry-manager recompute per group instead of one per
+            # pack() call, which dominates startup with dozens of sliders
+            row = 0
             for key in ['Location', 'Rotation']:
                 label = ttk.Label(group_frame, text=key)
-                label.pack(anchor='w')
+                label.grid(row=row, column=0, sticky='w')
+                row += 1
 
                 for i, value in enumerate(entry[key]):
-                    slider = tk.Scale(group_frame, from_=-100, to=100, orient='horizontal', length=150)
+                    slider = tk.Scale(group_frame, from_=-100, to=100, orient='horizontal', length=150,
+                                      command=functools.partial(self._on_body_change, entry, key, i))
                     slider.set(value)
-                    slider.pack(anchor='w')
-                    slider.bind("<ButtonRelease-1>", lambda event, entry=entry, key=key, i=i: self.update_body(entry, key, i, event.widget.get()))
+                    slider.grid(row=row, column=0, sticky='w')
+                    row += 1
 
     def create_face_sliders(self, parent):
         """Create sliders for the Face data."""
@@ -129,38 +146,57 @@ class LiveLinkController:
             label = ttk.Label(frame, text=name)
             label.pack()
 
-            slider = tk.Scale(frame, from_=0, to=1, resolution=0.01, orient='horizontal', length=150)
+            slider = tk.Scale(frame, from_=0, to=1, resolution=0.01, orient='horizontal', length=150,
+                              command=functools.partial(self._on_face_change, index))
             slider.set(weight)
             slider.pack()
-            slider.bind("<ButtonRelease-1>", lambda event, index=index: self.update_face(index, event.widget.get()))
+
+    def _on_body_change(self, entry, key, index, value):
+        """Scale command callback: fires per movement, debounced by the flush timer."""
+        self.update_body(entry, key, index, int(float(value)))
+
+    def _on_face_change(self, index, value):
+        """Scale command callback: fires per movement, debounced by the flush timer."""
+        self.update_face(index, float(value))
 
     def update_body(self, entry, key, index, value):
-        """Update the Body data and send the entire message."""
+        """Update the Body data in place and schedule a coalesced send."""
         if self.send_mode in ["Both", "Body"]:
-            self.data['Audio2Face']['Body'] = [{
-                "Name": e["Name"],
-                "ParentName": e["ParentName"],
-                "Location": e["Location"],
-                "Rotation": e["Rotation"]
-            } for e in self.data['Audio2Face']['Body']]
-
-            body_data = {
-                "Body": self.data['Audio2Face']['Body'],
-                "FrameTiming": self.data['Audio2Face'].get('FrameTiming', {})
-            }
-            self.send_data({"Audio2Face": {**body_data}})
-            print(f"Updated Body: {entry['Name']} {key}[{index}] = {value}")
+            entry[key][index] = value
+            self._body_dirty = True
+            self._schedule_flush()
+            logger.debug("Updated Body: %s %s[%d] = %s", entry['Name'], key, index, value)
 
     def update_face(self, index, value):
-        """Update the Face data and send it."""
+        """Update the Face data in place and schedule a coalesced send."""
         if self.send_mode in ["Both", "Facial"]:
             self.data['Audio2Face']['Facial']['Weights'][index] = value
-            facial_data = {
+            self._face_dirty = True
+            self._schedule_flush()
+            logger.debug("Updated Face: %s = %s", self.data['Audio2Face']['Facial']['Names'][index], value)
+
+    def _schedule_flush(self):
+        """Arm a single ~60Hz timer; repeated slider events within the window
+        mutate the in-memory dict and share one serialization + send."""
+        if self._flush_after_id is None:
+            self._flush_after_id = self.root.after(15, self._flush)
+
+    def _flush(self):
+        """Send the current state of all dirty sections in one pass."""
+        self._flush_after_id = None
+        frame_timing = self.data['Audio2Face'].get('FrameTiming', {})
+        if self._body_dirty:
+            self._body_dirty = False
+            self.send_data({"Audio2Face": {
+                "Body": self.data['Audio2Face']['Body'],
+                "FrameTiming": frame_timing
+            }})
+        if self._face_dirty:
+            self._face_dirty = False
+            self.send_data({"Audio2Face": {
                 "Facial": self.data['Audio2Face']['Facial'],
-                "FrameTiming": self.data['Audio2Face'].get('FrameTiming', {})
-            }
-            self.send_data({"Audio2Face": {**facial_data}})
-            print(f"Updated Face: {self.data['Audio2Face']['Facial']['Names'][index]} = {value}")
+                "FrameTiming": frame_timing
+            }})
 
     def close(self):
         """Close the socket connection."""
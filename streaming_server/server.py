@@ -51,12 +51,15 @@ class Audio2FaceServicer(audio2face_pb2_grpc.Audio2FaceServicer):
         instance_name = request.instance_name
         samplerate = request.samplerate
         block_until_playback_is_finished = request.block_until_playback_is_finished
+        # Zero-copy read-only view over the protobuf bytes field; callbacks
+        # that keep the array beyond this call must copy it themselves
         audio_data = np.frombuffer(request.audio_data, dtype=np.float32)
 
-        logger.info(
-            "PushAudio request: [instance_name = %s ; samplerate = %d ; data.shape = %s]",
-            instance_name, samplerate, audio_data.shape
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "PushAudio request: [instance_name = %s ; samplerate = %d ; num_samples = %d]",
+                instance_name, samplerate, audio_data.size
+            )
         if self._audio_start_callback is not None:
             try:
                 self._audio_start_callback(instance_name, samplerate)
@@ -98,7 +101,8 @@ class Audio2FaceServicer(audio2face_pb2_grpc.Audio2FaceServicer):
             except RuntimeError as e:
                 return audio2face_pb2.PushAudioResponse(success=False, message=str(e))
 
-        # Process the remaining audio chunks
+        # Process the remaining audio chunks; frombuffer is a zero-copy
+        # read-only view per chunk, and nothing is logged inside the loop
         for item in request_iterator:
             audio_data = np.frombuffer(item.audio_data, dtype=np.float32)
             if self._push_chunk_callback is not None and instance_name is not None:
@@ -120,13 +124,24 @@ class Audio2FaceServicer(audio2face_pb2_grpc.Audio2FaceServicer):
 class StreamingServer:
     def __init__(self):
         self._server = None
-        self._max_workers = 10  # ADJUST
+        # PushAudioStream RPCs are long-lived and can pin worker threads, so
+        # scale the pool with the machine instead of a fixed count
+        self._max_workers = max(8, (os.cpu_count() or 4) * 2)
         self._port = "50051"  # ADJUST
         self._address = f"[::]:{self._port}"  # ADJUST
 
     def start(self, audio_start_callback, push_chunk_callback, audio_end_callback):
         logger.info("Starting StreamingServer on port %s", self._port)
-        self._server = grpc.server(futures.ThreadPoolExecutor(max_workers=self._max_workers))
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="a2f-grpc"
+            ),
+            options=[
+                ("grpc.max_receive_message_length", 64 * 1024 * 1024),
+                ("grpc.so_reuseport", 1),
+                ("grpc.keepalive_time_ms", 30000),
+            ],
+        )
         audio2face_pb2_grpc.add_Audio2FaceServicer_to_server(
             Audio2FaceServicer(audio_start_callback, push_chunk_callback, audio_end_callback), self._server
         )
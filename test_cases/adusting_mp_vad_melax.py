@@ -7,9 +7,14 @@ from mediapipe.tasks.python.components.containers import AudioData
 from mediapipe.tasks.python.core.base_options import BaseOptions
 
 RunningMode = mp.tasks.audio.RunningMode
+import queue
 import threading
 import time
 
+# int16 full-scale reciprocal, kept as a float32 scalar so the per-buffer
+# normalization multiply never promotes to float64
+_INT16_RECIP = np.float32(1.0 / 32767.0)
+
 def print_result(result, timestamp_ms):
     """
     Callback function to process classification results.
@@ -52,24 +57,57 @@ def run_audio_streaming(stop_event, sample_rate=16000):
         start_time = time.time()
         total_samples = 0
 
+        # Slot-pool hand-off: chunks land in reusable rows of one backing
+        # array instead of per-callback copies, so steady-state streaming
+        # allocates nothing and the GC never sees the audio path. The
+        # SimpleQueues carry only slot indices and do not allocate on the
+        # fast path
+        pool_n = 8
+        slots = np.empty((pool_n, sample_rate), dtype=np.int16)
+        free_slots = queue.SimpleQueue()
+        for i in range(pool_n):
+            free_slots.put(i)
+        ready = queue.SimpleQueue()
+
         def audio_callback(indata, frames, time_info, status):
-            nonlocal total_samples
             if status:
                 print(f"Audio stream status: {status}")
 
-            # Normalize audio data
-            buffer = indata.flatten()
-            normalized_buffer = buffer.astype(float) / np.iinfo(np.int16).max
+            # Keep the realtime callback down to a memcpy into a pooled slot;
+            # normalization and classification happen on the worker thread
+            try:
+                i = free_slots.get_nowait()
+            except queue.Empty:
+                return  # worker has fallen behind; drop this chunk
+            n = min(frames, slots.shape[1])
+            slots[i, :n] = indata[:n, 0]
+            ready.put((i, n))
+
+        def classification_worker():
+            nonlocal total_samples
+            while not stop_event.is_set():
+                try:
+                    i, n = ready.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+
+                # float32 multiply: cheaper than a float64 divide and half
+                # the bandwidth; done here the slot can be recycled at once
+                normalized_buffer = slots[i, :n].astype(np.float32) * _INT16_RECIP
+                free_slots.put(i)
+
+                # Create AudioData
+                audio_data = AudioData.create_from_array(normalized_buffer, sample_rate)
 
-            # Create AudioData
-            audio_data = AudioData.create_from_array(normalized_buffer, sample_rate)
+                # Calculate timestamp based on the number of samples processed
+                timestamp_ms = int(start_time * 1000 + (total_samples / sample_rate) * 1000)
+                total_samples += n  # Update total samples processed
 
-            # Calculate timestamp based on the number of samples processed
-            timestamp_ms = int(start_time * 1000 + (total_samples / sample_rate) * 1000)
-            total_samples += frames  # Update total samples processed
+                # Classify asynchronously
+                classifier.classify_async(audio_data, timestamp_ms)
 
-            # Classify asynchronously
-            classifier.classify_async(audio_data, timestamp_ms)
+        worker = threading.Thread(target=classification_worker, daemon=True)
+        worker.start()
 
         # Initialize and start the audio stream
         stream = sd.InputStream(
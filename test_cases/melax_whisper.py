@@ -1,10 +1,34 @@
-import queue
 import threading
 import sounddevice as sd
 import numpy as np
 import whisper
 import torch
 import time
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4)
+def _get_whisper_model(model_name, device):
+    """Share one Whisper model per (name, device) across instances.
+
+    Loading takes seconds and allocates hundreds of MB to several GB of
+    (V)RAM; inference is stateless, so concurrent sessions can reuse it.
+    """
+    model = whisper.load_model(model_name, device=device)
+    if hasattr(torch, "compile"):
+        try:
+            # Compile the encoder and decoder submodules rather than the
+            # wrapper: whisper.decode pokes at model attributes and hooks
+            # that a compiled wrapper would hide, while the submodules see
+            # a fixed (80, 3000) mel shape every call, so reduce-overhead
+            # CUDA-graph capture pays off. Fall back silently where
+            # inductor lacks backend support for the device
+            model.encoder = torch.compile(model.encoder, mode="reduce-overhead")
+            model.decoder = torch.compile(model.decoder, mode="reduce-overhead")
+        except RuntimeError:
+            pass
+    return model
+
 
 class RealTimeWhisperASR:
     def __init__(self, model_name="base", device="cuda", chunk_duration=5, language="en"):
@@ -15,65 +39,151 @@ class RealTimeWhisperASR:
         :param chunk_duration: Duration of audio chunks in seconds.
         :param language: Language code for transcription.
         """
-        self.model = whisper.load_model(model_name, device=device)
+        self.model = _get_whisper_model(model_name, device)
         self.device = device
         self.chunk_duration = chunk_duration
         self.language = language
         self.sample_rate = 16000  # Whisper requires 16 kHz
-        self.audio_queue = queue.Queue()
         self.running = False
         self.transcription_thread = None
         self.stream = None
+        # Rolling log-mel cache covering Whisper's 30 s receptive field: each
+        # window contributes its mel frames once, so decode never recomputes
+        # the mel transform for audio it has already seen and never pushes
+        # 25 s of zero padding through the transform per call
+        self._mel_cache = None
+        self._mel_filled = 0
+        self._silence_mel = None
+        self._last_text = ""  # tail context carried across window boundaries
+        # Lock-free single-producer/single-consumer ring: the PortAudio
+        # callback only advances _ring_write and the worker only advances
+        # _ring_read, so no queue, mutex, or per-callback allocation is needed
+        self._ring = np.empty(self.sample_rate * 30, dtype=np.float32)
+        self._ring_write = 0  # total samples captured (monotonic)
+        self._ring_read = 0  # total samples consumed (monotonic)
+        # Byte view of the ring for the capture callback: copying through it
+        # is a straight memcpy with no numpy machinery on the realtime thread
+        self._ring_bytes = memoryview(self._ring).cast("B")
+        self._ring_nbytes = self._ring_bytes.nbytes
+        self._sample_size = self._ring.itemsize
+        # The callback signals this event after each write so the worker
+        # wakes exactly when new samples land instead of sleep-polling
+        self._data_ready = threading.Event()
 
     def _audio_callback(self, indata, frames, time, status):
         """Callback function to handle incoming audio data."""
         if status:
             print(f"Audio callback status: {status}")
-        self.audio_queue.put(indata.copy())
+        # RawInputStream hands over PortAudio's raw cffi buffer; a memoryview
+        # slice-copy into the ring's byte view moves the samples with plain
+        # memcpys and no ndarray construction on the realtime thread
+        src = memoryview(indata).cast("B")
+        nbytes = src.nbytes
+        cap_b = self._ring_nbytes
+        pos = (self._ring_write * self._sample_size) % cap_b
+        end = pos + nbytes
+        if end <= cap_b:
+            self._ring_bytes[pos:end] = src
+        else:
+            first = cap_b - pos
+            self._ring_bytes[pos:] = src[:first]
+            self._ring_bytes[: end - cap_b] = src[first:]
+        self._ring_write += nbytes // self._sample_size
+        self._data_ready.set()
+
+    def _read_ring(self, n):
+        """Copy the next n samples out of the capture ring."""
+        cap = self._ring.shape[0]
+        pos = self._ring_read % cap
+        end = pos + n
+        if end <= cap:
+            out = self._ring[pos:end].copy()
+        else:
+            out = np.concatenate((self._ring[pos:], self._ring[: end - cap]))
+        self._ring_read += n
+        return out
 
     def _process_audio(self):
         """Process audio chunks and transcribe them."""
-        audio_buffer = np.empty((0,), dtype=np.float32)
+        window = self.chunk_duration * self.sample_rate
 
         while self.running:
             try:
-                # Get audio chunk from the queue
-                audio_chunk = self.audio_queue.get(timeout=1)
-                audio_buffer = np.append(audio_buffer, audio_chunk.flatten())
-
                 # Process chunks of the specified duration
-                if len(audio_buffer) >= self.chunk_duration * self.sample_rate:
-                    print("Processing audio chunk...")
-                    audio = whisper.pad_or_trim(audio_buffer)
-                    print(f"Audio buffer shape: {audio.shape}")
-
-                    # Perform transcription
-                    result = self.model.transcribe(
-                        audio,
-                        language=self.language,
-                        fp16=torch.cuda.is_available(),
-                    )
-                    print(f"Transcription: {result['text']}")
+                if self._ring_write - self._ring_read < window:
+                    self._data_ready.wait(timeout=0.1)
+                    self._data_ready.clear()
+                    continue
+                print("Processing audio chunk...")
+                audio_buffer = self._read_ring(window)
+
+                # Append only the new window's mel frames to the cache
+                mel = whisper.log_mel_spectrogram(audio_buffer).to(self.device)
+                n = min(mel.shape[-1], self._mel_cache.shape[-1] - self._mel_filled)
+                self._mel_cache[:, self._mel_filled:self._mel_filled + n] = mel[:, :n]
+                self._mel_filled += n
+
+                # Decode once per full 30 s window rather than per chunk;
+                # the encoder's receptive field is 30 s, so decoding every
+                # 5 s re-encoded mostly the same window up to six times
+                if self._mel_filled < self._mel_cache.shape[-1]:
+                    continue
+
+                options = whisper.DecodingOptions(
+                    language=self.language,
+                    fp16=torch.cuda.is_available(),
+                    without_timestamps=True,
+                    prompt=self._last_text[-200:] or None,
+                )
+                result = whisper.decode(self.model, self._mel_cache, options)
+                print(f"Transcription: {result.text}")
+                self._last_text = result.text
 
-                    # Clear processed buffer
-                    audio_buffer = np.empty((0,), dtype=np.float32)
+                # Slide the window: keep the last chunk's mel frames as
+                # overlap so context continues across the boundary
+                overlap = mel.shape[-1]
+                self._mel_cache[:, :overlap] = self._mel_cache[:, -overlap:].clone()
+                self._mel_cache[:, overlap:] = self._silence_mel[:, overlap:]
+                self._mel_filled = overlap
 
-            except queue.Empty:
-                continue
             except Exception as e:
                 print(f"Error during transcription: {e}")
 
     def start(self):
         """Start the audio stream and transcription."""
         self.running = True
+        # Seed the mel cache with the mel of silence before capture starts:
+        # unfilled frames match what pad_or_trim + log_mel would produce, and
+        # the first window skips the one-off filterbank/FFT warm-up
+        if self._mel_cache is None:
+            silence = np.zeros(whisper.audio.N_SAMPLES, dtype=np.float32)
+            self._silence_mel = whisper.log_mel_spectrogram(silence).to(self.device)
+            self._mel_cache = self._silence_mel.clone()
+            self._mel_filled = 0
+            # Decode the silence mel once so torch.compile captures its
+            # CUDA graphs now; the shape never changes, so every later
+            # decode replays the cached graph
+            try:
+                whisper.decode(
+                    self.model,
+                    self._silence_mel,
+                    whisper.DecodingOptions(
+                        language=self.language,
+                        fp16=torch.cuda.is_available(),
+                        without_timestamps=True,
+                    ),
+                )
+            except Exception:
+                pass
         self.transcription_thread = threading.Thread(target=self._process_audio)
         self.transcription_thread.start()
 
         print("Starting audio stream...")
-        self.stream = sd.InputStream(
+        self.stream = sd.RawInputStream(
             samplerate=self.sample_rate,
             channels=1,
             dtype="float32",
+            blocksize=1024,
             callback=self._audio_callback,
         )
         self.stream.start()
@@ -9,11 +9,16 @@ from mediapipe.tasks.python.core.base_options import BaseOptions
 import mediapipe
 RunningMode = mediapipe.tasks.audio.RunningMode
 import requests
+from requests.adapters import HTTPAdapter
 import os
 import time
-from scipy.io.wavfile import write
-import io
-import json
+
+# orjson's C parser is several times faster on the NDJSON responses when
+# installed; fall back to the stdlib parser otherwise
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 class OutputParser:
     def __init__(self, *, show_all: bool, with_confidence: bool) -> None:
@@ -34,10 +39,12 @@ class OutputParser:
 
     @staticmethod
     def convert_to_result(response_text: str):
-        for line in response_text.split("\n"):
+        # The response is newline-delimited JSON where most lines are empty;
+        # iterate lazily and return on the first populated result
+        for line in response_text.splitlines():
             if not line:
                 continue
-            result = json.loads(line)["result"]
+            result = _loads(line)["result"]
             if len(result) != 0:
                 if len(result[0].get("alternative", [])) == 0:
                     raise ValueError("No alternatives available in response.")
@@ -74,6 +81,20 @@ class RealTimeSpeakingTranscriberGoogleAPI:
         self.total_samples = 0
         self.parser = OutputParser(show_all=False, with_confidence=True)
 
+        # One pooled session keeps the TCP (and TLS) connection alive across
+        # utterances; headers and query params never change, so they are set
+        # once here instead of rebuilt per request
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers["Content-Type"] = "audio/l16; rate=16000"
+        self._session.params = {
+            "key": self.api_key,
+            "output": "json",
+            "lang": "en-US",
+        }
+
         # Configure MediaPipe AudioClassifier in streaming mode
         base_options = BaseOptions(model_asset_path=audio_model_path)
         self.audio_classifier_options = AudioClassifierOptions(
@@ -97,27 +118,19 @@ class RealTimeSpeakingTranscriberGoogleAPI:
                     self.speaking_buffer = np.empty((0,), dtype=np.float32)
                 self.is_speaking = False
 
-    import io  # For in-memory binary streams
-
     def _transcribe(self, audio_data):
         """Transcribe audio using Google Speech-to-Text API without file writing."""
         print("Transcribing audio buffer...")
         try:
-            # Convert the audio buffer to WAV format in memory
-            wav_buffer = io.BytesIO()
-            write(wav_buffer, self.sample_rate, (audio_data * 32767).astype(np.int16))
-            wav_buffer.seek(0)  # Rewind the buffer to the beginning
-
-            # Send HTTP request to Google Speech API
-            headers = {"Content-Type": "audio/l16; rate=16000"}
-            params = {
-                "key": self.api_key,
-                "output": "json",
-                "lang": "en-US",  # Specify the language
-            }
-            response = requests.post(
-                self.endpoint, params=params, headers=headers, data=wav_buffer.read()
-            )
+            # The endpoint accepts raw LINEAR16 PCM, so skip the in-memory WAV
+            # container entirely and post the sample bytes directly.
+            # Scale and cast in one pass straight into the int16 target,
+            # avoiding the scaled float intermediate plus astype copy
+            pcm = np.empty(audio_data.shape, dtype=np.int16)
+            np.multiply(audio_data, 32767.0, out=pcm, casting="unsafe")
+
+            # Send HTTP request to Google Speech API over the pooled session
+            response = self._session.post(self.endpoint, data=pcm.tobytes())
 
             # Parse response using OutputParser
             if response.status_code == 200:
@@ -138,12 +151,9 @@ class RealTimeSpeakingTranscriberGoogleAPI:
         if status:
             print(f"Audio stream status: {status}")
 
-        # Normalize audio data
-        buffer = indata.flatten()
-        normalized_buffer = buffer.astype(float) / np.iinfo(np.int16).max
-
-        # Create AudioData
-        audio_data = AudioData.create_from_array(normalized_buffer, self.sample_rate)
+        # The stream delivers float32 in [-1, 1] already, so the samples go
+        # straight into the container with no normalization pass or copies
+        audio_data = AudioData.create_from_array(indata.reshape(-1), self.sample_rate)
 
         # Calculate timestamp based on the number of samples processed
         timestamp_ms = int(self.start_time * 1000 + (self.total_samples / self.sample_rate) * 1000)
@@ -164,7 +174,7 @@ class RealTimeSpeakingTranscriberGoogleAPI:
         self.stream = sd.InputStream(
             samplerate=self.sample_rate,
             channels=1,
-            dtype="int16",
+            dtype="float32",
             callback=self._audio_callback,
         )
         self.stream.start()
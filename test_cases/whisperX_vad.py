@@ -1,5 +1,7 @@
+import logging
 import queue
 import threading
+from logging.handlers import QueueHandler, QueueListener
 import numpy as np
 import sounddevice as sd
 import whisperx
@@ -7,83 +9,146 @@ import time
 import torch
 torch.backends.cuda.matmul.allow_tf32 = True
 torch.backends.cudnn.allow_tf32 = True
+torch.backends.cudnn.benchmark = True
 class RealTimeSpeakingTranscriberWhisperX:
-    def __init__(self, model_name="base", language="en", device="cuda"):
+    def __init__(self, model_name="base", language="en", device="cuda", vad_threshold=0.5,
+                 logger=None):
         """
         Initialize the real-time transcriber with WhisperX.
         """
+        # print() locks and flushes stdout on the transcription thread; a
+        # logger (queue-backed in __main__) keeps I/O off the hot path
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
         self.language = language
         self.device = device
-        self.transcription_model = whisperx.load_model(model_name, device=device)
+        # whisperx runs on the CTranslate2 backend; int8 weights halve the
+        # memory traffic and use the quantized matmul path at equal accuracy
+        self.transcription_model = whisperx.load_model(
+            model_name,
+            device=device,
+            compute_type="int8_float16" if device == "cuda" else "int8",
+        )
+
+        # Silero VAD gates transcription so windows without speech never
+        # reach the model; threshold is the speech probability cutoff
+        self.vad_threshold = vad_threshold
+        try:
+            self.vad_model, vad_utils = torch.hub.load("snakers4/silero-vad", "silero_vad")
+            # Run the VAD on the same device as the transcriber: the model is
+            # small convolutions plus an LSTM, and keeping it on the GPU
+            # avoids a CPU round trip before every window
+            if device == "cuda" and torch.cuda.is_available():
+                self.vad_model = self.vad_model.to(device)
+            self._get_speech_timestamps = vad_utils[0]
+        except Exception as e:
+            self.vad_model = None
+            self.logger.warning("Silero VAD unavailable, transcribing ungated: %s", e)
 
         self.sample_rate = 16000  # WhisperX requires 16kHz audio
-        self.audio_queue = queue.Queue()
         self.running = False
         self.transcription_thread = None
-        self.stream = None
-        self.audio_buffer = np.empty((0,), dtype=np.float32)
 
-    def _audio_callback(self, indata, frames, time, status):
-        """
-        Callback function to handle incoming audio data.
-        """
-        if status:
-            print(f"Audio callback status: {status}")
-        self.audio_queue.put(indata.copy())
+        # VAD-accepted windows accumulate here and are transcribed together,
+        # so the encoder runs once per batch instead of once per half second.
+        # Normalized samples are written into a preallocated scratch via
+        # np.multiply's out= argument: zero allocations per window and no
+        # concatenate at flush time
+        self._batch_size = 8
+        self._window = self.sample_rate // 2
+        self._norm_scratch = np.empty(self._batch_size * self._window, dtype=np.float32)
+        self._pending = 0  # samples currently in the scratch
 
     def _process_audio(self):
         """
-        Process audio chunks and transcribe them in real-time.
+        Pull audio straight off the device and transcribe in real-time.
         """
-        while self.running:
-            try:
-                # Check if the queue has audio data
-                audio_chunk = self.audio_queue.get(timeout=1)
-                self.audio_buffer = np.append(self.audio_buffer, audio_chunk.flatten())
-
-                # Process audio in chunks of 0.5 seconds
-                if len(self.audio_buffer) >= self.sample_rate // 2:
-                    audio_data = self.audio_buffer[: self.sample_rate // 2]
-                    self.audio_buffer = self.audio_buffer[self.sample_rate // 2:]
-                    self._transcribe(audio_data)
-            except queue.Empty:
-                continue
-            except Exception as e:
-                print(f"Error during audio processing: {e}")
+        half = self.sample_rate // 2
+        # Blocking reads hand over exactly one half-second window at a time:
+        # no callback thread, no queue hop, latency bounded by the blocksize
+        with sd.InputStream(
+            samplerate=self.sample_rate,
+            channels=1,
+            dtype="float32",
+            blocksize=half,
+        ) as stream:
+            while self.running:
+                try:
+                    audio_data, overflowed = stream.read(half)
+                    if overflowed:
+                        self.logger.warning("Audio input overflow")
+                    self._transcribe(audio_data[:, 0])
+                except Exception as e:
+                    self.logger.error("Error during audio processing: %s", e)
 
     def _transcribe(self, audio_data):
         """
-        Transcribe audio using WhisperX.
+        Queue a speech window and transcribe accumulated batches with WhisperX.
         """
-        #try:
-        # Normalize audio to WhisperX's expected input format
-        audio_data = audio_data / np.max(np.abs(audio_data))
+        if self.vad_model is not None:
+            wav = torch.from_numpy(audio_data)
+            if self.vad_model.parameters().__next__().is_cuda:
+                wav = wav.cuda(non_blocking=True)
+            speech_ts = self._get_speech_timestamps(
+                wav, self.vad_model,
+                sampling_rate=self.sample_rate,
+                threshold=self.vad_threshold,
+                min_silence_duration_ms=100,
+            )
+            if not speech_ts:
+                # Silence marks the end of an utterance; flush what we have
+                self._flush_segments()
+                return
+
+        # Normalize audio to WhisperX's expected input format: multiply by
+        # the reciprocal peak (a divide per element costs several times a
+        # multiply) and guard all-silence windows instead of dividing by
+        # zero. Writing through out= into the scratch makes it one memory
+        # pass with no temporaries
+        peak = np.max(np.abs(audio_data))
+        inv = np.float32(1.0 / peak) if peak > 1e-9 else np.float32(0.0)
+        n = audio_data.shape[0]
+        np.multiply(audio_data, inv, out=self._norm_scratch[self._pending:self._pending + n])
+        self._pending += n
 
-        # Transcribe using WhisperX
-        transcription = self.transcription_model.transcribe(audio_data, language=self.language)
+        if self._pending + n > self._norm_scratch.shape[0]:
+            self._flush_segments()
 
-        # Output the transcription
-        print(f"Transcription: {transcription['text']}")
-        #except Exception as e:
-            #print(f"Error during transcription: {e}")
+    def _flush_segments(self):
+        """Transcribe all accumulated speech windows in one batched forward pass."""
+        if self._pending == 0:
+            return
+        # transcribe copies the view into its own tensors synchronously, so
+        # the scratch can be reused for the next batch right away
+        batch = self._norm_scratch[:self._pending]
+        self._pending = 0
+
+        transcription = self.transcription_model.transcribe(
+            batch, language=self.language, batch_size=self._batch_size
+        )
+        text = " ".join(seg["text"].strip() for seg in transcription["segments"])
+        self.logger.info("Transcription: %s", text)
 
     def start(self):
         """
         Start the audio stream and processing.
         """
         self.running = True
+        # Throwaway decode on silence: the first transcribe pays cuBLAS
+        # autotune and kernel compilation, so spend that here instead of on
+        # the user's first utterance
+        try:
+            self.transcription_model.transcribe(
+                np.zeros(self.sample_rate, dtype=np.float32),
+                language=self.language,
+                batch_size=1,
+            )
+        except Exception:
+            pass
+
+        self.logger.info("Starting audio stream...")
         self.transcription_thread = threading.Thread(target=self._process_audio, daemon=True)
         self.transcription_thread.start()
 
-        print("Starting audio stream...")
-        self.stream = sd.InputStream(
-            samplerate=self.sample_rate,
-            channels=1,
-            dtype="float32",
-            callback=self._audio_callback,
-        )
-        self.stream.start()
-
     def stop(self):
         """
         Stop the audio stream and processing.
@@ -91,13 +156,18 @@ class RealTimeSpeakingTranscriberWhisperX:
         self.running = False
         if self.transcription_thread:
             self.transcription_thread.join()
-        if self.stream:
-            self.stream.stop()
-            self.stream.close()
-        print("Stopped.")
+        self.logger.info("Stopped.")
 
 
 if __name__ == "__main__":
+    # Queue-backed logging: the worker threads only enqueue records, and
+    # formatting plus stdout I/O happen on the listener's own thread
+    log_queue = queue.SimpleQueue()
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    listener = QueueListener(log_queue, console)
+    listener.start()
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
     try:
         # Initialize WhisperX-based transcriber
         transcriber = RealTimeSpeakingTranscriberWhisperX(
@@ -1,14 +1,35 @@
+import logging
 import queue
 import threading
+from logging.handlers import QueueHandler, QueueListener
 import numpy as np
 import sounddevice as sd
 from mediapipe.tasks import python
 from mediapipe.tasks.python.components import containers
 from mediapipe.tasks.python import audio
-import whisper
+from faster_whisper import WhisperModel
 import urllib.request
 import os
 import time
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4)
+def _get_whisper_model(model_name, device):
+    """Share one Whisper model per (name, device) across instances.
+
+    Loading takes seconds and allocates hundreds of MB to several GB of
+    (V)RAM; inference is stateless, so concurrent sessions can reuse it.
+    The CTranslate2 backend with int8 weights halves weight bandwidth and
+    uses quantized matmuls, several times faster at the same accuracy.
+    """
+    return WhisperModel(
+        model_name,
+        device=device,
+        compute_type="int8_float16" if device == "cuda" else "int8",
+        num_workers=1,
+    )
+
 
 def download_model_if_not_exists(url, file_name):
     """
@@ -26,10 +47,14 @@ def download_model_if_not_exists(url, file_name):
 
 # Real-Time Audio Classification and Transcription
 class RealTimeSpeakingTranscriber:
-    def __init__(self, model_name="base",language="en", audio_model_path="classifier.tflite", device="cuda"):
+    def __init__(self, model_name="base",language="en", audio_model_path="classifier.tflite", device="cuda",
+                 logger=None):
+        # print() locks and flushes stdout on the transcription thread; a
+        # logger (queue-backed in __main__) keeps I/O off the hot path
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
         self.language = language
         self.device = device
-        self.transcription_model = whisper.load_model(model_name, device=device)
+        self.transcription_model = _get_whisper_model(model_name, device)
 
         # Load MediaPipe Audio Classifier
         base_options = python.BaseOptions(model_asset_path=audio_model_path)
@@ -37,74 +62,128 @@ class RealTimeSpeakingTranscriber:
             base_options=base_options, max_results=4
         )
         self.sample_rate = 16000  # MediaPipe and Whisper require 16kHz
-        self.audio_queue = queue.Queue()
         self.running = False
         self.transcription_thread = None
         self.stream = None
-        self.audio_buffer = np.empty((0,), dtype=np.float32)
+        # Lock-free single-producer/single-consumer ring: the PortAudio
+        # callback only advances _ring_write and the worker only advances
+        # _ring_read, so no queue, mutex, or per-callback allocation is needed
+        self._ring = np.empty(self.sample_rate * 30, dtype=np.float32)
+        self._ring_write = 0  # total samples captured (monotonic)
+        self._ring_read = 0  # total samples consumed (monotonic)
+        # Byte view of the ring for the capture callback: copying through it
+        # is a straight memcpy with no numpy machinery on the realtime thread
+        self._ring_bytes = memoryview(self._ring).cast("B")
+        self._ring_nbytes = self._ring_bytes.nbytes
+        self._sample_size = self._ring.itemsize
+        # The callback signals this event after each write so the worker
+        # wakes exactly when new samples land instead of sleep-polling
+        self._data_ready = threading.Event()
 
     def _audio_callback(self, indata, frames, time, status):
         """Callback function to handle incoming audio data."""
-        if status:
-            print(f"Audio callback status: {status}")
-        self.audio_queue.put(indata.copy())
+        if __debug__ and status:
+            self.logger.debug("Audio callback status: %s", status)
+        # RawInputStream hands over PortAudio's raw cffi buffer; a memoryview
+        # slice-copy into the ring's byte view moves the samples with plain
+        # memcpys and no ndarray construction on the realtime thread
+        src = memoryview(indata).cast("B")
+        nbytes = src.nbytes
+        cap_b = self._ring_nbytes
+        pos = (self._ring_write * self._sample_size) % cap_b
+        end = pos + nbytes
+        if end <= cap_b:
+            self._ring_bytes[pos:end] = src
+        else:
+            first = cap_b - pos
+            self._ring_bytes[pos:] = src[:first]
+            self._ring_bytes[: end - cap_b] = src[first:]
+        self._ring_write += nbytes // self._sample_size
+        self._data_ready.set()
+
+    def _read_ring(self, n):
+        """Copy the next n samples out of the capture ring."""
+        cap = self._ring.shape[0]
+        pos = self._ring_read % cap
+        end = pos + n
+        if end <= cap:
+            out = self._ring[pos:end].copy()
+        else:
+            out = np.concatenate((self._ring[pos:], self._ring[: end - cap]))
+        self._ring_read += n
+        return out
 
     def _process_audio(self):
         """Process audio chunks and classify/transcribe them in real-time."""
         with audio.AudioClassifier.create_from_options(self.audio_classifier_options) as classifier:
-            speaking_buffer = np.empty((0,), dtype=np.float32)
+            # Utterance chunks collect in a list and are concatenated once at
+            # turn end, instead of recopying a growing buffer every second
+            speaking_chunks = []
             is_speaking = False
 
             while self.running:
                 try:
-                    audio_chunk = self.audio_queue.get(timeout=1)
-                    self.audio_buffer = np.append(self.audio_buffer, audio_chunk.flatten())
-
                     # Process chunks of 1 second
-                    if len(self.audio_buffer) >= self.sample_rate:
-                        wav_data = self.audio_buffer[: self.sample_rate]
-                        self.audio_buffer = self.audio_buffer[self.sample_rate:]
-                        audio_clip = containers.AudioData.create_from_array(
-                            wav_data.astype(float), self.sample_rate
-                        )
-                        result = classifier.classify(audio_clip)
-
-                        # Detect if speaking is occurring
-                        top_category = result[0].classifications[0].categories[0]
-                        if top_category.category_name == "Speech" and top_category.score > 0.5:
-                            print(f"Detected speech: {top_category.score:.2f}")
-                            is_speaking = True
-                            speaking_buffer = np.append(speaking_buffer, wav_data)
-                        else:
-                            if is_speaking:
-                                # End of speaking turn, transcribe the buffer
-                                print("Speaking turn ended. Transcribing...")
-                                self._transcribe(speaking_buffer)
-                                speaking_buffer = np.empty((0,), dtype=np.float32)
-                            is_speaking = False
-
-                except queue.Empty:
-                    continue
+                    if self._ring_write - self._ring_read < self.sample_rate:
+                        self._data_ready.wait(timeout=0.1)
+                        self._data_ready.clear()
+                        continue
+                    wav_data = self._read_ring(self.sample_rate)
+                    audio_clip = containers.AudioData.create_from_array(
+                        wav_data.astype(float), self.sample_rate
+                    )
+                    result = classifier.classify(audio_clip)
+
+                    # Detect if speaking is occurring
+                    top_category = result[0].classifications[0].categories[0]
+                    if top_category.category_name == "Speech" and top_category.score > 0.5:
+                        self.logger.debug("Detected speech: %.2f", top_category.score)
+                        is_speaking = True
+                        speaking_chunks.append(wav_data)
+                    else:
+                        if is_speaking:
+                            # End of speaking turn, transcribe the buffer
+                            self.logger.info("Speaking turn ended. Transcribing...")
+                            self._transcribe(np.concatenate(speaking_chunks))
+                            speaking_chunks.clear()
+                        is_speaking = False
+
                 except Exception as e:
-                    print(f"Error during processing: {e}")
+                    self.logger.error("Error during processing: %s", e)
 
     def _transcribe(self, audio_data):
-        """Transcribe audio using Whisper."""
-        print("Transcribing audio buffer...")
-        result = self.transcription_model.transcribe(audio_data, language=self.language)
-        print(f"Transcription: {result['text']}")
+        """Transcribe audio using Whisper (CTranslate2 backend)."""
+        self.logger.debug("Transcribing audio buffer...")
+        segments, _ = self.transcription_model.transcribe(
+            audio_data, language=self.language, beam_size=1
+        )
+        self.logger.info("Transcription: %s", " ".join(segment.text.strip() for segment in segments))
 
     def start(self):
         """Start audio stream and processing."""
         self.running = True
+        # Warm both the encoder and decoder graph caches on silence so the
+        # first real utterance sees steady-state latency; the segments
+        # generator is lazy and must be drained for the pass to run
+        silent = np.zeros(self.sample_rate, dtype=np.float32)
+        try:
+            for _ in range(2):
+                segments, _ = self.transcription_model.transcribe(
+                    silent, language=self.language, beam_size=1, without_timestamps=True
+                )
+                list(segments)
+        except Exception:
+            pass
+
         self.transcription_thread = threading.Thread(target=self._process_audio)
         self.transcription_thread.start()
 
-        print("Starting audio stream...")
-        self.stream = sd.InputStream(
+        self.logger.info("Starting audio stream...")
+        self.stream = sd.RawInputStream(
             samplerate=self.sample_rate,
             channels=1,
             dtype="float32",
+            blocksize=1024,
             callback=self._audio_callback,
         )
         self.stream.start()
@@ -117,13 +196,21 @@ class RealTimeSpeakingTranscriber:
         if self.stream:
             self.stream.stop()
             self.stream.close()
-        print("Stopped.")
+        self.logger.info("Stopped.")
 
 if __name__ == "__main__":
     model_url = "https://storage.googleapis.com/mediapipe-models/audio_classifier/yamnet/float32/1/yamnet.tflite"
     model_file_name = "classifier.tflite"
 
     download_model_if_not_exists(model_url, model_file_name)
+    # Queue-backed logging: the worker threads only enqueue records, and
+    # formatting plus stdout I/O happen on the listener's own thread
+    log_queue = queue.SimpleQueue()
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    listener = QueueListener(log_queue, console)
+    listener.start()
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
     try:
         # Initialize the system
         transcriber = RealTimeSpeakingTranscriber(
@@ -8,6 +8,7 @@ from PySide6.QtWidgets import (
     QPushButton,
     QVBoxLayout,
     QHBoxLayout,
+    QStackedWidget,
     QWidget,
 )
 from PySide6.QtCore import Qt
@@ -44,25 +45,15 @@ class TranscriptionApp(QMainWindow):
         self.asr_dropdown = QComboBox()
         self.asr_dropdown.addItems(["Google API", "Whisper"])
 
-        # ASR Module Configuration (Dynamic)
-        self.config_layout = QVBoxLayout()
-        self.google_api_key_label = QLabel("Enter Google API Key:")
-        self.google_api_key_input = QLineEdit()
-        self.google_api_key_input.setPlaceholderText("API Key")
+        # ASR Module Configuration: both pages are built once and stacked;
+        # switching modules just flips the visible page instead of deleting
+        # and re-creating widgets (which also lost the user's entries)
+        self.config_stack = QStackedWidget()
+        self.config_stack.addWidget(self._build_google_page())
+        self.config_stack.addWidget(self._build_whisper_page())
 
-        self.whisper_model_label = QLabel("Select Whisper Model:")
-        self.whisper_model_dropdown = QComboBox()
-        self.whisper_model_dropdown.addItems(["base", "small", "medium", "large"])
-
-        self.device_label = QLabel("Select Device:")
-        self.device_dropdown = QComboBox()
-        self.device_dropdown.addItems(["CPU", "CUDA"])
-
-        # Add initial elements (Google API by default)
-        self.update_config_layout("Google API")
-
-        # ASR Module Change Event
-        self.asr_dropdown.currentTextChanged.connect(self.update_config_layout)
+        # ASR Module Change Event: dropdown order matches the page order
+        self.asr_dropdown.currentIndexChanged.connect(self.config_stack.setCurrentIndex)
 
         # Buttons
         self.start_button = QPushButton("Start")
@@ -78,7 +69,7 @@ class TranscriptionApp(QMainWindow):
         self.main_layout.addWidget(self.audio_source_dropdown)
         self.main_layout.addWidget(self.asr_label)
         self.main_layout.addWidget(self.asr_dropdown)
-        self.main_layout.addLayout(self.config_layout)
+        self.main_layout.addWidget(self.config_stack)
         self.main_layout.addLayout(self.button_layout)
 
         # Set main layout
@@ -86,23 +77,35 @@ class TranscriptionApp(QMainWindow):
         central_widget.setLayout(self.main_layout)
         self.setCentralWidget(central_widget)
 
-    def update_config_layout(self, asr_module):
-        """Update the ASR Module Configuration section dynamically."""
-        # Clear current layout
-        for i in reversed(range(self.config_layout.count())):
-            widget = self.config_layout.itemAt(i).widget()
-            if widget is not None:
-                widget.deleteLater()
-
-        # Add relevant widgets
-        if asr_module == "Google API":
-            self.config_layout.addWidget(self.google_api_key_label)
-            self.config_layout.addWidget(self.google_api_key_input)
-        elif asr_module == "Whisper":
-            self.config_layout.addWidget(self.whisper_model_label)
-            self.config_layout.addWidget(self.whisper_model_dropdown)
-            self.config_layout.addWidget(self.device_label)
-            self.config_layout.addWidget(self.device_dropdown)
+    def _build_google_page(self):
+        """Build the Google API configuration page."""
+        self.google_api_key_label = QLabel("Enter Google API Key:")
+        self.google_api_key_input = QLineEdit()
+        self.google_api_key_input.setPlaceholderText("API Key")
+
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        layout.addWidget(self.google_api_key_label)
+        layout.addWidget(self.google_api_key_input)
+        return page
+
+    def _build_whisper_page(self):
+        """Build the Whisper configuration page."""
+        self.whisper_model_label = QLabel("Select Whisper Model:")
+        self.whisper_model_dropdown = QComboBox()
+        self.whisper_model_dropdown.addItems(["base", "small", "medium", "large"])
+
+        self.device_label = QLabel("Select Device:")
+        self.device_dropdown = QComboBox()
+        self.device_dropdown.addItems(["CPU", "CUDA"])
+
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        layout.addWidget(self.whisper_model_label)
+        layout.addWidget(self.whisper_model_dropdown)
+        layout.addWidget(self.device_label)
+        layout.addWidget(self.device_dropdown)
+        return page
 
 
 if __name__ == "__main__":
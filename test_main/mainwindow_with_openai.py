@@ -1,6 +1,6 @@
 import sys
 import speech_recognition as sr
-import whisper
+from faster_whisper import WhisperModel
 import openai
 from PySide6.QtWidgets import QApplication, QMainWindow, QMessageBox
 from PySide6.QtCore import QThread, Signal, Slot
@@ -29,7 +29,14 @@ class WhisperTranscriptionThread(QThread):
             self.logger.log_info("Starting Whisper Transcription Thread")
             recorder = sr.Recognizer()
             source = sr.Microphone(sample_rate=16000)
-            audio_model = whisper.load_model(self.model_name, device=self.device)
+            # CTranslate2 backend with int8 weights: several-fold faster
+            # transcription than openai-whisper at the same accuracy
+            audio_model = WhisperModel(
+                self.model_name,
+                device=self.device,
+                compute_type="int8_float16" if self.device == "cuda" else "int8",
+                num_workers=1,
+            )
 
             def record_callback(_, audio: sr.AudioData):
                 if not self.running:
@@ -37,8 +44,8 @@ class WhisperTranscriptionThread(QThread):
 
                 data = audio.get_raw_data()
                 audio_np = np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
-                result = audio_model.transcribe(audio_np, language=self.language)
-                text = result['text'].strip()
+                segments, _ = audio_model.transcribe(audio_np, language=self.language)
+                text = " ".join(segment.text.strip() for segment in segments)
                 self.transcription_signal.emit(text)
 
             with source:
@@ -1,6 +1,13 @@
+import shutil
 import urllib.request
 import os
 import sounddevice as sd
+
+# Files already confirmed present this process; repeat calls (bulk model
+# staging at startup) skip the stat syscall entirely
+_VERIFIED_MODELS = set()
+
+
 def download_model_if_not_exists(url, file_name):
     """
     Downloads a model file from the given URL if it doesn't already exist.
@@ -8,12 +15,24 @@ def download_model_if_not_exists(url, file_name):
     :param url: The URL to download the model from.
     :param file_name: The name to save the model file as.
     """
-    if not os.path.exists(file_name):
-        print(f"{file_name} not found. Downloading...")
-        urllib.request.urlretrieve(url, file_name)
-        print(f"Downloaded {file_name}.")
-    else:
+    if file_name in _VERIFIED_MODELS:
+        return
+    try:
+        # One stat instead of exists() (which stats and swallows the result)
+        os.stat(file_name)
+        _VERIFIED_MODELS.add(file_name)
         print(f"{file_name} already exists. Skipping download.")
+        return
+    except FileNotFoundError:
+        pass
+
+    print(f"{file_name} not found. Downloading...")
+    # Stream with a 1 MB buffer; urlretrieve copies in small default-sized
+    # blocks, which is noticeably slower for multi-hundred-MB models
+    with urllib.request.urlopen(url) as response, open(file_name, "wb") as f:
+        shutil.copyfileobj(response, f, length=1024 * 1024)
+    _VERIFIED_MODELS.add(file_name)
+    print(f"Downloaded {file_name}.")
 
 
 def list_microphones():